@@ -0,0 +1,205 @@
+"""macOSスクリーンキャプチャ（Quartz + screencaptureフォールバック）"""
+
+import logging
+import os
+import subprocess
+import time
+from pathlib import Path
+
+import pyautogui
+
+logger = logging.getLogger(__name__)
+
+# === 型エイリアス ===
+Region = tuple[int, int, int, int]  # (x, y, width, height)
+
+# === キーイベントの定数 ===
+# macOS仮想キーコード（Carbon HIToolbox由来）
+_KEY_CODES = {"left": 123, "right": 124}
+
+# pyobjcはocrmac経由で入るが、無い環境でも動くようフォールバックを持つ
+try:
+    import Quartz
+
+    _HAS_QUARTZ = True
+except ImportError:  # pragma: no cover
+    _HAS_QUARTZ = False
+
+try:
+    from AppKit import NSApplicationActivateIgnoringOtherApps, NSRunningApplication
+
+    _HAS_APPKIT = True
+except ImportError:  # pragma: no cover
+    _HAS_APPKIT = False
+
+
+def has_quartz() -> bool:
+    """Quartzによるインプロセスキャプチャが利用可能か"""
+    return _HAS_QUARTZ
+
+
+def _capture_cgimage(region: Region):
+    """指定領域のCGImageを取得する（プロセス生成なし）"""
+    x, y, width, height = region
+    return Quartz.CGWindowListCreateImage(
+        Quartz.CGRectMake(x, y, width, height),
+        Quartz.kCGWindowListOptionOnScreenOnly,
+        Quartz.kCGNullWindowID,
+        Quartz.kCGWindowImageDefault,
+    )
+
+
+def _write_cgimage_png(image, path: str | Path) -> bool:
+    """CGImageをPNGファイルとして書き出す"""
+    url = Quartz.CFURLCreateWithFileSystemPath(
+        None, str(path), Quartz.kCFURLPOSIXPathStyle, False
+    )
+    destination = Quartz.CGImageDestinationCreateWithURL(url, "public.png", 1, None)
+    if destination is None:
+        return False
+    Quartz.CGImageDestinationAddImage(destination, image, None)
+    return bool(Quartz.CGImageDestinationFinalize(destination))
+
+
+def _capture_with_screencapture(region: Region, path: str | Path) -> bool:
+    """screencaptureコマンドでキャプチャする（フォールバック）"""
+    x, y, width, height = region
+    result = subprocess.run(
+        ["screencapture", "-x", "-C", "-R", f"{x},{y},{width},{height}", str(path)],
+        capture_output=True,
+    )
+    if result.returncode != 0:
+        error_msg = result.stderr.decode() if result.stderr else "不明なエラー"
+        logger.debug("screencaptureが失敗しました: %s", error_msg)
+        return False
+    return os.path.exists(path)
+
+
+def _copy_raw_pixels(image) -> bytes | None:
+    """CGImageの生ピクセルバイト列をコピーして返す"""
+    provider = Quartz.CGImageGetDataProvider(image)
+    if provider is None:
+        return None
+    data = Quartz.CGDataProviderCopyData(provider)
+    if data is None:
+        return None
+    return bytes(data)
+
+
+def capture_region_data(region: Region, path: str | Path) -> tuple[bool, bytes | None]:
+    """
+    指定領域をPNGとしてpathに保存し、可能なら生ピクセルも返す
+
+    Quartzパスでは保存に使ったCGImageから生ピクセルバイト列を
+    コピーして返すため、呼び出し側はハッシュ計算のためにPNGを
+    再読込・デコードする必要がない。フォールバック時はNone。
+
+    Args:
+        region: キャプチャ領域 (x, y, width, height)
+        path: 保存先のPNGファイルパス
+
+    Returns:
+        (成功フラグ, 生ピクセルバイト列またはNone)
+    """
+    if _HAS_QUARTZ:
+        image = _capture_cgimage(region)
+        if image is not None and _write_cgimage_png(image, path):
+            return True, _copy_raw_pixels(image)
+        logger.debug("Quartzキャプチャに失敗したためscreencaptureを使用します")
+    return _capture_with_screencapture(region, path), None
+
+
+def activate_app(bundle_id: str, timeout: float, poll_interval: float = 0.05) -> bool:
+    """
+    起動済みアプリを最前面化し、アクティブになるまでポーリングで待つ
+
+    固定スリープと違い、アクティブ化が完了した時点で即座に返る。
+    AppKitが使えない場合やアプリが起動していない場合はFalseを
+    返すので、呼び出し側でosascript等にフォールバックすること。
+
+    Args:
+        bundle_id: 対象アプリのバンドルID
+        timeout: アクティブ化を待つ上限秒数
+        poll_interval: isActiveのポーリング間隔（秒）
+
+    Returns:
+        True: アクティブ化を確認できた
+    """
+    if not _HAS_APPKIT:
+        return False
+
+    apps = NSRunningApplication.runningApplicationsWithBundleIdentifier_(bundle_id)
+    if not apps:
+        return False
+
+    app = apps[0]
+    app.activateWithOptions_(NSApplicationActivateIgnoringOtherApps)
+
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if app.isActive():
+            return True
+        time.sleep(poll_interval)
+    return bool(app.isActive())
+
+
+def press_key(key: str) -> None:
+    """
+    キーを1回押下する（page送り用）
+
+    Quartzが使える場合はCGEventを直接ポストする。pyautogui.pressの
+    キー名変換・内部スリープを挟まないため、1回あたりの
+    オーバーヘッドが数十ms小さい。キーコード表にないキーや
+    Quartzなしの環境ではpyautoguiにフォールバックする。
+
+    Args:
+        key: キー名（"left" / "right" など）
+    """
+    key_code = _KEY_CODES.get(key)
+    if _HAS_QUARTZ and key_code is not None:
+        down = Quartz.CGEventCreateKeyboardEvent(None, key_code, True)
+        up = Quartz.CGEventCreateKeyboardEvent(None, key_code, False)
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, down)
+        Quartz.CGEventPost(Quartz.kCGHIDEventTap, up)
+        return
+
+    pyautogui.press(key)
+
+
+def capture_region_pixels(region: Region) -> bytes | None:
+    """
+    指定領域の生ピクセルバイト列をメモリ上だけで取得する
+
+    ファイルへの書き込みを伴わないため、描画安定チェックのような
+    高頻度の小領域キャプチャに向く。Quartzが使えない場合はNone。
+
+    Args:
+        region: キャプチャ領域 (x, y, width, height)
+
+    Returns:
+        生ピクセルバイト列、または取得できない場合None
+    """
+    if not _HAS_QUARTZ:
+        return None
+    image = _capture_cgimage(region)
+    if image is None:
+        return None
+    return _copy_raw_pixels(image)
+
+
+def capture_region(region: Region, path: str | Path) -> bool:
+    """
+    指定領域をPNGとしてpathに保存する
+
+    Quartzが使える場合はプロセス内でキャプチャし（fork/exec不要）、
+    使えない場合はscreencaptureコマンドにフォールバックする。
+
+    Args:
+        region: キャプチャ領域 (x, y, width, height)
+        path: 保存先のPNGファイルパス
+
+    Returns:
+        True: キャプチャ成功
+    """
+    success, _ = capture_region_data(region, path)
+    return success
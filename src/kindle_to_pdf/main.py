@@ -1,10 +1,20 @@
 import argparse
 import hashlib
+import itertools
+import json
 import logging
+import os
+import queue
+import select
 import shutil
+import struct
 import subprocess
 import sys
+import threading
 import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
@@ -12,11 +22,20 @@ import fitz  # PyMuPDF
 import pyautogui
 from PIL import Image
 
+from .capture import (
+    activate_app,
+    capture_region,
+    capture_region_data,
+    capture_region_pixels,
+    press_key,
+)
 from .ocr import (
+    FRAMEWORK_VISION,
     OcrConfig,
+    _iter_merged_paragraphs,
+    _recognize_with_retry,
     detect_text_orientation,
     recognize_text_batch,
-    _merge_paragraph_lines,
 )
 
 # ロガーの設定
@@ -28,20 +47,65 @@ DIRECTION_VERTICAL = "vertical"
 DIRECTION_HORIZONTAL = "horizontal"
 VALID_DIRECTIONS = (DIRECTION_AUTO, DIRECTION_VERTICAL, DIRECTION_HORIZONTAL)
 
+# 方向検出結果のキャッシュファイル名（スクリーンショットと同じ場所に置く）
+DIRECTION_CACHE_NAME = ".direction.json"
+
+# 方向確認プロンプトの応答待ち時間（秒）。経過後はデフォルトで続行する
+PROMPT_TIMEOUT_SECONDS = 10.0
+
+# KindleアプリのバンドルID
+KINDLE_BUNDLE_ID = "com.amazon.Kindle"
+
 # === リージョン設定の定数 ===
 REGION_LEFT = "left"
 REGION_RIGHT = "right"
 REGION_FULL = "full"
 VALID_REGIONS = (REGION_LEFT, REGION_RIGHT, REGION_FULL)
 
+# === 出力ファイル名の定数 ===
+# ファイルシステムで使えない文字をまとめて置換する変換テーブル
+_FILENAME_SANITIZE_TABLE = str.maketrans({c: "_" for c in '\\/:*?"<>|\t\n'})
+
+# === パイプライン設定の定数 ===
+# キャプチャ→OCR間のキュー上限（バックプレッシャでメモリを抑える）
+PIPELINE_QUEUE_SIZE = 32
+
+# === 最終ページ検出の定数 ===
+# average hashのサムネイルサイズ（8x8 = 64bit）
+AHASH_SIZE = 8
+# 同一ページとみなすハミング距離の上限
+AHASH_DISTANCE_THRESHOLD = 2
+
+# === 描画安定待ちの定数 ===
+# 安定チェック用プローブ領域の一辺のピクセル数
+SETTLE_PROBE_SIZE = 128
+# 待ち時間の較正に必要な実測サンプル数
+SETTLE_CALIBRATION_MIN_SAMPLES = 10
+# 較正後の上限に加える安全マージン（秒）
+SETTLE_CALIBRATION_GUARD = 0.05
+
+# === PNGヘッダの定数 ===
+_PNG_SIGNATURE = b"\x89PNG\r\n\x1a\n"
+
+# === PDF構築の定数 ===
+# 並列構築時に1スレッドが担当するページ数
+PDF_SHARD_SIZE = 64
+# 不可視テキストレイヤーのフォントサイズ（検索用なので見た目には影響しない）
+PDF_TEXT_FONTSIZE = 10
+# 1ページに埋め込むテキストの上限（OCRの暴走出力からレイアウトを守る）
+PDF_TEXT_MAX_CHARS = 20000
+
 
 @dataclass
 class PdfConfig:
     """PDF最適化設定"""
 
     garbage: int = 4  # 未使用オブジェクトの削除レベル
-    deflate: bool = True  # 画像データの圧縮
-    clean: bool = True  # 重複オブジェクトの削除
+    deflate: bool = True  # ストリームの圧縮
+    deflate_images: bool = False  # 画像ストリームの再圧縮（PNG由来は圧縮済み）
+    deflate_fonts: bool = True  # フォントデータの圧縮
+    clean: bool = False  # コンテンツストリームの再構文解析（garbage=4と重複しがち）
+    use_mutool: bool = False  # 保存後の最適化を外部のmutoolに任せる
 
 
 @dataclass
@@ -67,7 +131,9 @@ class AppConfig:
     """アプリケーション設定"""
 
     max_pages: int = 1000  # 最大ページ数
-    page_turn_delay: float = 0.6  # ページ送り後の待機時間（秒）
+    grayscale: bool = False  # スクリーンショットを8bitグレースケール化する
+    page_turn_delay: float = 0.6  # ページ送り後の最大待機時間（秒）
+    settle_poll_interval: float = 0.05  # 描画安定チェックのポーリング間隔（秒）
     kindle_activation_delay: float = 2.0  # Kindle起動後の待機時間（秒）
     screenshot_dir: Path = field(default_factory=lambda: Path("screenshots"))
     output_dir: Path = field(default_factory=lambda: Path("output"))
@@ -76,17 +142,83 @@ class AppConfig:
     ocr: OcrConfig = field(default_factory=OcrConfig)
 
 
+def _build_pdf_shard(pages: list[tuple[Path, str]]) -> bytes:
+    """
+    (画像パス, OCRテキスト)の列からサブPDFを構築してバイト列として返す
+
+    OCRテキストは不可視のテキストレイヤーとして各ページに重ねる
+    （検索・コピー用）。MuPDFは画像の取り込み・圧縮中にGILを
+    解放するため、スレッドごとに独立したDocumentを組み立てれば
+    並列化できる。
+    """
+    doc = fitz.open()
+    # フォントのロードはシャードにつき1回で済ませる
+    font = fitz.Font("cjk")
+
+    for image_path, text in pages:
+        raw = image_path.read_bytes()
+        width, height = _png_dimensions(raw)
+        page = doc.new_page(width=width, height=height)
+        page.insert_image(page.rect, stream=raw)
+
+        if text:
+            # render_mode=3は塗り・輪郭なしの不可視テキスト
+            writer = fitz.TextWriter(page.rect)
+            writer.fill_textbox(
+                page.rect, text[:PDF_TEXT_MAX_CHARS], font=font, fontsize=PDF_TEXT_FONTSIZE
+            )
+            writer.write_text(page, render_mode=3)
+
+    data = doc.tobytes()
+    doc.close()
+    return data
+
+
+def _png_dimensions(data: bytes) -> tuple[int, int]:
+    """
+    PNGヘッダ（IHDRチャンク）から幅と高さを読み取る
+
+    先頭24バイトだけを見るためフルデコードは発生しない。
+    PNGとして不正な場合はValueErrorを送出する。
+    """
+    if len(data) < 24 or not data.startswith(_PNG_SIGNATURE) or data[12:16] != b"IHDR":
+        raise ValueError("PNGヘッダが不正です")
+    width, height = struct.unpack(">II", data[16:24])
+    return width, height
+
+
+def _page_number(path: Path) -> int:
+    """page_12.png -> 12（ファイル名形式は固定なのでスライスで取り出す）"""
+    return int(path.stem[5:])  # "page_" の後ろが数値
+
+
 def get_page_turn_key(vertical_mode: bool) -> str:
     """テキスト方向に応じたページ送りキーを返す"""
     return "left" if vertical_mode else "right"
 
 
-def prompt_vertical_mode(confidence: float) -> bool:
+def _read_line_with_timeout(timeout: float) -> str | None:
+    """
+    標準入力から1行読み取る（timeout秒以内に入力がなければNone）
+
+    blocking input()と違い、無人実行時にパイプライン全体が
+    人間の応答待ちで止まり続けることがない。
+    """
+    ready, _, _ = select.select([sys.stdin], [], [], timeout)
+    if not ready:
+        return None
+    return sys.stdin.readline()
+
+
+def prompt_vertical_mode(confidence: float, timeout: float = PROMPT_TIMEOUT_SECONDS) -> bool:
     """
     縦書きモードを使用するかユーザーに確認する
 
+    timeout秒以内に応答がない場合はデフォルト（縦書き）で続行する。
+
     Args:
         confidence: 検出の信頼度 (0.0-1.0)
+        timeout: 応答待ちの上限秒数
 
     Returns:
         True if vertical mode, False if horizontal mode
@@ -97,18 +229,25 @@ def prompt_vertical_mode(confidence: float) -> bool:
     print("縦書きモードに切り替えますか？")
     print("  [y] 縦書き（←キーでページ送り）")
     print("  [n] 横書きのまま（→キーでページ送り）")
-    print("  [Enter] 縦書きに切り替え")
+    print(f"  [Enter] 縦書きに切り替え（{int(timeout)}秒で自動選択）")
 
     while True:
+        print("> ", end="", flush=True)
         try:
-            user_input = input("> ").strip().lower()
-        except (EOFError, KeyboardInterrupt):
+            line = _read_line_with_timeout(timeout)
+        except (OSError, ValueError, KeyboardInterrupt):
             print()
             return True  # デフォルトは縦書きに切り替え
 
-        if user_input == "":
+        if line is None:
+            print("\n応答がないため縦書きモードで続行します")
             return True
-        elif user_input in ("y", "yes"):
+        if line == "":  # EOF
+            print()
+            return True
+
+        user_input = line.strip().lower()
+        if user_input in ("", "y", "yes"):
             return True
         elif user_input in ("n", "no"):
             return False
@@ -129,6 +268,22 @@ class KindleToPDF:
         self.region = region
         self.output_filename = output_filename
         self.ocr_results: dict[int, str] = {}  # ページ番号 -> OCRテキスト
+        # コンテンツ領域のキャッシュ（画面サイズは実行中変わらない）
+        self._content_region: tuple[int, int, int, int] | None = None
+        # ソート済みファイル一覧のキャッシュ（キャプチャ完了時に明示的に無効化）
+        self._sorted_files_cache: list[tuple[int, Path]] | None = None
+        # 描画安定までの実測時間（待ち上限の較正用）
+        self._settle_samples: list[float] = []
+
+        # リージョン名 -> (左端, 右端) の画面幅に対する比率
+        # 分岐ではなくテーブル参照にすることで、未知のリージョンが
+        # 暗黙にfull扱いへ落ちるのを防ぐ（KeyErrorで即座に気付ける）
+        m = self.config.margin
+        self._region_fractions: dict[str, tuple[float, float]] = {
+            REGION_LEFT: (m.left, m.half_position),
+            REGION_RIGHT: (m.half_position, 1 - m.right),
+            REGION_FULL: (m.left, 1 - m.right),
+        }
 
         # 方向設定の初期化
         if direction == DIRECTION_VERTICAL:
@@ -149,7 +304,9 @@ class KindleToPDF:
     def _get_output_path(self, extension: str) -> Path:
         """出力ファイルパスを生成"""
         if self.output_filename:
-            filename = f"{self.output_filename}.{extension}"
+            # 不正な文字を一括置換（translateは1パスで処理できる）
+            safe_name = self.output_filename.translate(_FILENAME_SANITIZE_TABLE)
+            filename = f"{safe_name.strip('_') or 'kindle_book'}.{extension}"
         else:
             timestamp = time.strftime("%Y%m%d_%H%M%S")
             filename = f"kindle_book_{timestamp}.{extension}"
@@ -158,6 +315,13 @@ class KindleToPDF:
     def activate_kindle(self) -> None:
         """Kindleアプリを最前面に表示"""
         logger.info("Kindleアプリを最前面に表示します...")
+
+        # 起動済みならAppKit経由で同期的にアクティブ化し、isActiveの
+        # ポーリングで完了を待つ（固定スリープ不要）
+        if activate_app(KINDLE_BUNDLE_ID, timeout=self.config.kindle_activation_delay):
+            return
+
+        # 未起動またはAppKitが使えない場合はosascriptで起動する
         try:
             script = '''
             tell application "Amazon Kindle"
@@ -172,22 +336,19 @@ class KindleToPDF:
             raise
 
     def get_kindle_content_region(self) -> tuple[int, int, int, int]:
-        """Kindleのコンテンツ表示領域を取得"""
+        """Kindleのコンテンツ表示領域を取得（初回計算後はキャッシュ）"""
+        if self._content_region is not None:
+            return self._content_region
+
         screen_width, screen_height = pyautogui.size()
         margin = self.config.margin
 
         top_margin = int(screen_height * margin.top)
         bottom_margin = int(screen_height * margin.bottom)
 
-        if self.region == "left":
-            left_margin = int(screen_width * margin.left)
-            right_margin = int(screen_width * margin.half_position)
-        elif self.region == "right":
-            left_margin = int(screen_width * margin.half_position)
-            right_margin = int(screen_width * (1 - margin.right))
-        else:  # 'full'
-            left_margin = int(screen_width * margin.left)
-            right_margin = int(screen_width * (1 - margin.right))
+        left_fraction, right_fraction = self._region_fractions[self.region]
+        left_margin = int(screen_width * left_fraction)
+        right_margin = int(screen_width * right_fraction)
 
         left = left_margin
         top = top_margin
@@ -200,110 +361,273 @@ class KindleToPDF:
             left, top, width, height,
         )
 
-        return (left, top, width, height)
+        self._content_region = (left, top, width, height)
+        return self._content_region
 
     @staticmethod
-    def _image_hash(image: Image.Image) -> str:
-        """画像のハッシュ値を計算"""
-        return hashlib.md5(image.tobytes()).hexdigest()
+    def _image_hash(image: Image.Image) -> int:
+        """
+        画像のaverage hash（64bit）を計算
 
-    def _take_screenshot(
-        self, screenshot_path: Path, content_region: tuple[int, int, int, int]
-    ) -> None:
-        """1ページのスクリーンショットを取得"""
-        x, y, width, height = content_region
-        result = subprocess.run(
-            [
-                "screencapture",
-                "-x",
-                "-C",
-                "-R",
-                f"{x},{y},{width},{height}",
-                str(screenshot_path),
-            ],
-            capture_output=True,
-        )
+        グレースケールの8x8サムネイルに縮小し、平均輝度との比較で
+        各ピクセルを1bitに落とす。フル解像度のピクセル列を
+        ハッシュするより大幅に軽く、描画のわずかなゆらぎにも頑健。
+        """
+        # NEARESTはリサンプリング計算が不要で最速。指紋用途には十分
+        thumb = image.convert("L").resize((AHASH_SIZE, AHASH_SIZE), Image.Resampling.NEAREST)
+        pixels = list(thumb.getdata())
+        average = sum(pixels) / len(pixels)
+        bits = 0
+        for pixel in pixels:
+            bits = (bits << 1) | (pixel > average)
+        return bits
+
+    @staticmethod
+    def _hashes_match(hash_a: int, hash_b: int) -> bool:
+        """2つのaverage hashが同一ページとみなせるか判定"""
+        return (hash_a ^ hash_b).bit_count() <= AHASH_DISTANCE_THRESHOLD
 
-        if result.returncode != 0:
-            error_msg = result.stderr.decode() if result.stderr else "不明なエラー"
-            raise RuntimeError(f"スクリーンショットの取得に失敗しました: {error_msg}")
+    @staticmethod
+    def _fast_hash(path: str | Path, raw_pixels: bytes | None) -> bytes:
+        """
+        デコード不要の高速ハッシュを計算する
+
+        Quartzキャプチャで生ピクセルが得られた場合はそれを、
+        得られなかった場合はPNGファイルのバイト列をハッシュする。
+        「前ページと完全一致か」の判定にのみ使う。
+        """
+        if raw_pixels is not None:
+            data = raw_pixels
+        else:
+            with open(path, "rb") as f:
+                data = f.read()
+        return hashlib.blake2b(data, digest_size=16).digest()
+
+    def _take_screenshot(
+        self, screenshot_path: str | Path, content_region: tuple[int, int, int, int]
+    ) -> bytes | None:
+        """
+        1ページのスクリーンショットを取得する
 
-        if not screenshot_path.exists():
+        Returns:
+            生ピクセルバイト列（Quartzパスのみ、ハッシュ用）
+        """
+        success, raw_pixels = capture_region_data(content_region, screenshot_path)
+        if not success:
             raise RuntimeError(
-                f"スクリーンショットファイルが作成されませんでした: {screenshot_path}"
+                f"スクリーンショットの取得に失敗しました: {screenshot_path}"
             )
 
+        if self.config.grayscale:
+            # 8bitグレースケールに量子化し、以降の全段（ハッシュ・OCR・
+            # PDF埋め込み）のデータ量を約1/4にする。重複判定は全ページが
+            # 同じ変換を通るため、変換前の生ピクセルのままで整合する
+            with Image.open(screenshot_path) as img:
+                img.convert("L").save(screenshot_path)
+
+        return raw_pixels
+
+    def _capture_probe(self, content_region: tuple[int, int, int, int]) -> bytes | None:
+        """
+        コンテンツ中央の小さなプローブ領域をキャプチャしてバイト列を返す
+
+        描画安定チェック用。失敗時はNoneを返す。
+        """
+        x, y, width, height = content_region
+        px = x + max((width - SETTLE_PROBE_SIZE) // 2, 0)
+        py = y + max((height - SETTLE_PROBE_SIZE) // 2, 0)
+        pw = min(SETTLE_PROBE_SIZE, width)
+        ph = min(SETTLE_PROBE_SIZE, height)
+        region = (px, py, pw, ph)
+
+        # Quartzが使える場合はディスクを介さずメモリ上で比較する
+        pixels = capture_region_pixels(region)
+        if pixels is not None:
+            return pixels
+
+        probe_path = self.config.screenshot_dir / ".probe.png"
+        if not capture_region(region, probe_path):
+            return None
+        return probe_path.read_bytes()
+
+    def _wait_for_page_settle(
+        self,
+        content_region: tuple[int, int, int, int],
+        pre_press_probe: bytes | None,
+        pressed_at: float,
+    ) -> None:
+        """
+        ページ送り後、描画が安定するまで待機する
+
+        プローブ領域を定期的にキャプチャし、「押下前と異なり、
+        かつ2回連続で同じ」になったら描画完了とみなして抜ける。
+        最悪でもpage_turn_delay経過で抜けるため、従来の固定待ちより
+        遅くなることはない。
+
+        Args:
+            content_region: スクリーンショット領域
+            pre_press_probe: キー押下前のプローブ（Noneなら固定待ち）
+            pressed_at: キー押下時刻（time.monotonic）
+        """
+        deadline = pressed_at + self._effective_page_turn_delay()
+
+        if pre_press_probe is None:
+            # プローブ取得に失敗した場合は従来の固定待ちにフォールバック
+            remaining = deadline - time.monotonic()
+            if remaining > 0:
+                time.sleep(remaining)
+            return
+
+        previous: bytes | None = None
+        while time.monotonic() < deadline:
+            time.sleep(self.config.settle_poll_interval)
+            probe = self._capture_probe(content_region)
+            if probe is None:
+                continue
+            if probe != pre_press_probe and probe == previous:
+                # 実測値を較正サンプルとして記録する
+                self._settle_samples.append(time.monotonic() - pressed_at)
+                return
+            previous = probe
+
+    def _effective_page_turn_delay(self) -> float:
+        """
+        ページ送り待ちの上限を返す（実測に基づく較正付き）
+
+        設定値page_turn_delayは保守的な上限。安定検出の実測が
+        十分集まったら95パーセンタイル+マージンに引き下げ、
+        最終ページ（=変化が来ないページ）での無駄な待ちを縮める。
+        """
+        samples = self._settle_samples
+        if len(samples) < SETTLE_CALIBRATION_MIN_SAMPLES:
+            return self.config.page_turn_delay
+
+        ordered = sorted(samples)
+        p95 = ordered[min(int(len(ordered) * 0.95), len(ordered) - 1)]
+        return min(self.config.page_turn_delay, p95 + SETTLE_CALIBRATION_GUARD)
+
     def _prepare_screenshot_dir(self) -> None:
         """スクリーンショットディレクトリを準備（既存を削除して新規作成）"""
+        self._sorted_files_cache = None
         screenshot_dir = self.config.screenshot_dir
         if screenshot_dir.exists():
-            file_count = len(list(screenshot_dir.glob("*.png")))
+            # Pathオブジェクトを生成せずファイル名だけ見て数える
+            with os.scandir(screenshot_dir) as entries:
+                file_count = sum(1 for entry in entries if entry.name.endswith(".png"))
             if file_count > 0:
                 logger.info("古いスクリーンショットを削除します（%d件）...", file_count)
-            shutil.rmtree(screenshot_dir)
+
+            # renameは一瞬で完了するため、時間のかかる実削除は
+            # バックグラウンドに回してキャプチャ開始を待たせない
+            trash_dir = screenshot_dir.with_name(
+                f".{screenshot_dir.name}_trash_{uuid.uuid4().hex}"
+            )
+            screenshot_dir.rename(trash_dir)
+            threading.Thread(
+                target=shutil.rmtree,
+                args=(trash_dir,),
+                kwargs={"ignore_errors": True},
+                daemon=True,
+            ).start()
         screenshot_dir.mkdir(parents=True, exist_ok=True)
 
     def _capture_first_page(
         self, content_region: tuple[int, int, int, int]
-    ) -> tuple[Path, str]:
+    ) -> tuple[Path, bytes, int]:
         """
         最初のページをキャプチャしてハッシュを返す
 
         Returns:
-            (screenshot_path, image_hash): スクリーンショットのパスとハッシュ値
+            (screenshot_path, file_hash, image_hash):
+                スクリーンショットのパス、ファイルハッシュ、average hash
         """
         screenshot_dir = self.config.screenshot_dir
         first_screenshot_path = screenshot_dir / "page_1.png"
-        self._take_screenshot(first_screenshot_path, content_region)
-        image_hash = self._image_hash(Image.open(first_screenshot_path))
-        return first_screenshot_path, image_hash
+        raw_pixels = self._take_screenshot(first_screenshot_path, content_region)
+        file_hash = self._fast_hash(first_screenshot_path, raw_pixels)
+        with Image.open(first_screenshot_path) as image:
+            image_hash = self._image_hash(image)
+            # autoモードの方向検出も同じデコード済み画像から行い、
+            # PNGの再読込を省く
+            if self.direction == DIRECTION_AUTO:
+                self._detect_and_apply_direction(image)
+        return first_screenshot_path, file_hash, image_hash
 
     def _capture_remaining_pages(
         self,
         content_region: tuple[int, int, int, int],
-        last_hash: str,
+        last_file_hash: bytes,
+        last_image_hash: int,
         start_page: int,
+        on_page_ready: Callable[[int, Path], None] | None = None,
     ) -> int:
         """
         残りのページをキャプチャし、総ページ数を返す
 
         Args:
             content_region: スクリーンショット領域
-            last_hash: 前ページの画像ハッシュ
+            last_file_hash: 前ページのファイルハッシュ
+            last_image_hash: 前ページのaverage hash
             start_page: 開始ページ番号
+            on_page_ready: ページ確定ごとに呼ぶコールバック
 
         Returns:
             総ページ数
         """
         screenshot_dir = self.config.screenshot_dir
+        # ホットループ内でのPosixPath生成を避けるため文字列で組み立てる
+        base = str(screenshot_dir)
         page = start_page
 
         # 最初のページ送り
-        pyautogui.press(self.page_turn_key)
-        time.sleep(self.config.page_turn_delay)
+        pre_press_probe = self._capture_probe(content_region)
+        press_key(self.page_turn_key)
+        self._wait_for_page_settle(content_region, pre_press_probe, time.monotonic())
 
         while True:
-            screenshot_path = screenshot_dir / f"page_{page}.png"
-            self._take_screenshot(screenshot_path, content_region)
-
-            screenshot = Image.open(screenshot_path)
-            current_hash = self._image_hash(screenshot)
-
-            if current_hash == last_hash:
+            screenshot_path = f"{base}/page_{page}.png"
+            raw_pixels = self._take_screenshot(screenshot_path, content_region)
+
+            # 次ページへの送りを先に発行し、描画待ちとハッシュ計算を重ねる
+            # （最終ページで余分に押しても次ページが無いため無害）
+            pre_press_probe = self._capture_probe(content_region)
+            press_key(self.page_turn_key)
+            pressed_at = time.monotonic()
+
+            # バイト列の完全一致はデコード不要の高速パス
+            current_file_hash = self._fast_hash(screenshot_path, raw_pixels)
+            if current_file_hash == last_file_hash:
+                is_duplicate = True
+                current_image_hash = last_image_hash
+            else:
+                # withブロックでデコード済みバッファを即座に解放する
+                with Image.open(screenshot_path) as screenshot:
+                    current_image_hash = self._image_hash(screenshot)
+                is_duplicate = self._hashes_match(current_image_hash, last_image_hash)
+
+            if is_duplicate:
                 logger.info("最後のページに到達しました")
-                screenshot_path.unlink()
+                os.unlink(screenshot_path)
                 break
 
-            last_hash = current_hash
+            last_file_hash = current_file_hash
+            last_image_hash = current_image_hash
 
-            pyautogui.press(self.page_turn_key)
+            if on_page_ready is not None:
+                on_page_ready(page, Path(screenshot_path))
 
             if page >= self.config.max_pages:
                 logger.warning("最大ページ数に達しました")
                 break
 
             page += 1
-            time.sleep(self.config.page_turn_delay)
+
+            # 固定スリープの代わりに描画の安定を待つ
+            # （ハッシュ計算に要した時間はpressed_at基準で差し引かれる）
+            self._wait_for_page_settle(content_region, pre_press_probe, pressed_at)
+
+        # プローブ用の一時ファイルを削除
+        (screenshot_dir / ".probe.png").unlink(missing_ok=True)
 
         return page - 1
 
@@ -312,7 +636,9 @@ class KindleToPDF:
         mode_str = "縦書き" if self.vertical_mode else "横書き"
         logger.info("テキスト方向: %s（%sキーでページ送り）", mode_str, self.page_turn_key)
 
-    def take_screenshots(self) -> int:
+    def take_screenshots(
+        self, on_page_ready: Callable[[int, Path], None] | None = None
+    ) -> int:
         """Kindleの全ページのスクリーンショットを取得"""
         logger.info("スクリーンショットの取得を開始します...")
 
@@ -322,19 +648,30 @@ class KindleToPDF:
         content_region = self.get_kindle_content_region()
         logger.info("スクリーンショット領域: %s", content_region)
 
-        first_path, last_hash = self._capture_first_page(content_region)
-
-        # autoモードの場合、テキスト方向を検出
-        if self.direction == DIRECTION_AUTO:
-            self._detect_and_apply_direction(first_path)
+        # autoモードの方向検出は_capture_first_page内で
+        # ハッシュ用にデコードした画像を使って行われる
+        first_path, last_file_hash, last_image_hash = self._capture_first_page(content_region)
 
         self._log_direction_info()
 
-        total_pages = self._capture_remaining_pages(content_region, last_hash, start_page=2)
+        # 方向設定が確定してから最初のページを通知する
+        if on_page_ready is not None:
+            on_page_ready(1, first_path)
+
+        total_pages = self._capture_remaining_pages(
+            content_region,
+            last_file_hash,
+            last_image_hash,
+            start_page=2,
+            on_page_ready=on_page_ready,
+        )
         logger.info("スクリーンショットの取得が完了しました。合計%dページ", total_pages)
+
+        # 新しいページ群が確定したので一覧キャッシュを破棄する
+        self._sorted_files_cache = None
         return total_pages
 
-    def _detect_text_direction(self, image_path: Path) -> tuple[str, float]:
+    def _detect_text_direction(self, image: Path | Image.Image) -> tuple[str, float]:
         """
         テキスト方向を検出して結果を返す（状態変更なし）
 
@@ -342,7 +679,7 @@ class KindleToPDF:
             (orientation, confidence): 検出された方向と信頼度
         """
         logger.info("テキスト方向を検出中...")
-        return detect_text_orientation(image_path)
+        return detect_text_orientation(image)
 
     def _apply_direction_setting(self, detected: str, confidence: float) -> None:
         """
@@ -361,23 +698,57 @@ class KindleToPDF:
             self.vertical_mode = False
         self.config.ocr.vertical_mode = self.vertical_mode
 
-    def _detect_and_apply_direction(self, image_path: Path) -> None:
+    def _detect_and_apply_direction(self, image: Path | Image.Image) -> None:
         """テキスト方向を検出し、設定を適用する"""
-        detected, confidence = self._detect_text_direction(image_path)
+        detected, confidence = self._detect_text_direction(image)
+        self._save_direction_cache(detected, confidence)
         self._apply_direction_setting(detected, confidence)
 
+    def _save_direction_cache(self, detected: str, confidence: float) -> None:
+        """方向検出の結果をスクリーンショットディレクトリに保存する"""
+        cache_path = self.config.screenshot_dir / DIRECTION_CACHE_NAME
+        try:
+            cache_path.write_text(
+                json.dumps({"orientation": detected, "confidence": confidence})
+            )
+        except OSError as e:
+            logger.debug("方向キャッシュの保存に失敗しました: %s", e)
+
+    def _load_direction_cache(self) -> tuple[str, float] | None:
+        """保存済みの方向検出結果を読み込む（なければNone）"""
+        cache_path = self.config.screenshot_dir / DIRECTION_CACHE_NAME
+        try:
+            data = json.loads(cache_path.read_text())
+            return str(data["orientation"]), float(data["confidence"])
+        except (OSError, ValueError, KeyError):
+            return None
+
     def _get_sorted_image_files(self) -> list[tuple[int, Path]]:
-        """スクリーンショットファイルをページ番号順でソートして返す"""
-        screenshot_dir = self.config.screenshot_dir
-        files = list(screenshot_dir.glob("page_*.png"))
+        """
+        スクリーンショットファイルをページ番号順でソートして返す
 
-        def get_page_number(path: Path) -> int:
-            # page_1.png -> 1
-            stem = path.stem  # "page_1"
-            return int(stem.split("_")[1])
+        perform_ocr・create_pdf・create_markdownなどが同じ一覧を使う
+        ため結果をキャッシュする。ディレクトリを書き換えるのはこの
+        クラス自身だけなので、キャプチャ側が明示的に無効化する方が
+        mtime比較（ファイルシステムの分解能に依存）より確実で速い。
+        """
+        if self._sorted_files_cache is not None:
+            return self._sorted_files_cache
 
-        sorted_files = sorted(files, key=get_page_number)
-        return [(get_page_number(f), f) for f in sorted_files]
+        screenshot_dir = self.config.screenshot_dir
+        if not screenshot_dir.is_dir():
+            return []
+
+        # Path.globより軽いos.scandirでファイル名だけを列挙する
+        files: list[tuple[int, Path]] = []
+        with os.scandir(screenshot_dir) as entries:
+            for entry in entries:
+                if entry.name.startswith("page_") and entry.name.endswith(".png"):
+                    path = Path(entry.path)
+                    files.append((_page_number(path), path))
+        files.sort(key=lambda pair: pair[0])
+        self._sorted_files_cache = files
+        return files
 
     def detect_direction_from_screenshots(self) -> None:
         """
@@ -387,13 +758,19 @@ class KindleToPDF:
         if self.direction != DIRECTION_AUTO:
             return
 
-        sorted_files = self._get_sorted_image_files()
-        if not sorted_files:
-            logger.warning("スクリーンショットがありません")
-            return
+        # キャプチャ時の検出結果が残っていればOCRによる再検出を省く
+        cached = self._load_direction_cache()
+        if cached is not None:
+            logger.info("保存済みの方向検出結果を使用します")
+            self._apply_direction_setting(*cached)
+        else:
+            sorted_files = self._get_sorted_image_files()
+            if not sorted_files:
+                logger.warning("スクリーンショットがありません")
+                return
 
-        first_page = sorted_files[0][1]
-        self._detect_and_apply_direction(first_page)
+            first_page = sorted_files[0][1]
+            self._detect_and_apply_direction(first_page)
 
         mode_str = "縦書き" if self.vertical_mode else "横書き"
         logger.info("テキスト方向: %s モードで処理します", mode_str)
@@ -429,75 +806,166 @@ class KindleToPDF:
 
         md_path = self._get_output_path("md")
 
-        # ページ順にテキストを連結
+        # ページ順に全ページの行を1本のイテレータとして連結する
+        # リストに積み直さないため行数分のappend・再確保が発生しない
         sorted_pages = sorted(self.ocr_results.keys())
-        all_lines: list[str] = []
-
-        for page_num in sorted_pages:
-            text = self.ocr_results[page_num].strip()
-            if text:
-                # 各ページのテキストを行に分割して追加
-                all_lines.extend(text.split("\n"))
-
-        # ページをまたぐ文章も結合（LLM RAG用に最適化）
-        merged_text = _merge_paragraph_lines(all_lines)
+        all_lines = itertools.chain.from_iterable(
+            text.split("\n")
+            for page_num in sorted_pages
+            if (text := self.ocr_results[page_num].strip())
+        )
 
-        # Markdownファイルに書き出し
-        md_path.write_text(merged_text, encoding="utf-8")
+        # ページをまたぐ文章も結合し、段落単位で逐次書き出す（LLM RAG用に最適化）
+        # 全文を1つの文字列に結合しないためピークメモリは段落1つ分で済む
+        with md_path.open("wb") as f:
+            first = True
+            for paragraph in _iter_merged_paragraphs(all_lines):
+                if not first:
+                    f.write(b"\n")
+                f.write(paragraph.encode("utf-8"))
+                first = False
 
         logger.info("Markdownファイルを作成しました: %s", md_path)
         return md_path
 
-    def create_pdf(self) -> Path:
+    def create_pdf(self, max_workers: int = 4) -> Path:
         """スクリーンショットからテキストレイヤー付きPDFを作成"""
         logger.info("PDFの作成を開始します...")
 
         pdf_path = self._get_output_path("pdf")
         pdf_config = self.config.pdf
 
-        doc = fitz.open()
         sorted_files = self._get_sorted_image_files()
+        # 空白のみのOCR結果はテキストレイヤー構築自体をスキップする
+        pages = [
+            (image_path, self.ocr_results.get(page_num, "").strip())
+            for page_num, image_path in sorted_files
+        ]
+
+        # PDF_SHARD_SIZEページ単位のサブPDFをワーカースレッドで構築し、
+        # ページ順を保ったままメインのDocumentへ連結する
+        shards = [
+            pages[start : start + PDF_SHARD_SIZE]
+            for start in range(0, len(pages), PDF_SHARD_SIZE)
+        ]
 
-        for page_num, image_path in sorted_files:
-            logger.info("PDF処理中: %s", image_path.name)
-
-            img = Image.open(image_path)
-
-            # PDFページを作成
-            page = doc.new_page(width=img.width, height=img.height)
-
-            # 画像を挿入
-            page.insert_image(page.rect, filename=str(image_path))
+        doc = fitz.open()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for index, shard_bytes in enumerate(executor.map(_build_pdf_shard, shards)):
+                shard_doc = fitz.open("pdf", shard_bytes)
+                doc.insert_pdf(shard_doc)
+                shard_doc.close()
+                logger.info("PDF処理中: %d/%d シャード完了", index + 1, len(shards))
 
         logger.info("PDFの保存を開始します...")
-        logger.debug(
-            "最適化設定: garbage=%d, deflate=%s, clean=%s",
-            pdf_config.garbage,
-            pdf_config.deflate,
-            pdf_config.clean,
-        )
 
-        doc.save(
-            str(pdf_path),
-            garbage=pdf_config.garbage,
-            deflate=pdf_config.deflate,
-            clean=pdf_config.clean,
-        )
+        if pdf_config.use_mutool and shutil.which("mutool"):
+            self._save_pdf_with_mutool(doc, pdf_path)
+        else:
+            logger.debug(
+                "最適化設定: garbage=%d, deflate=%s, deflate_images=%s, clean=%s",
+                pdf_config.garbage,
+                pdf_config.deflate,
+                pdf_config.deflate_images,
+                pdf_config.clean,
+            )
+            doc.save(
+                str(pdf_path),
+                garbage=pdf_config.garbage,
+                deflate=pdf_config.deflate,
+                deflate_images=pdf_config.deflate_images,
+                deflate_fonts=pdf_config.deflate_fonts,
+                clean=pdf_config.clean,
+            )
         doc.close()
 
         logger.info("PDFファイルを作成しました: %s", pdf_path)
         return pdf_path
 
+    def _save_pdf_with_mutool(self, doc: fitz.Document, pdf_path: Path) -> None:
+        """
+        最小設定で保存し、圧縮・整理をmutoolに任せる
+
+        MuPDFのgarbage=4+deflateはPythonスレッド上で逐次実行されるが、
+        mutool cleanは同等の最適化を別プロセスで行える。
+        """
+        tmp_path = pdf_path.with_suffix(".tmp.pdf")
+        doc.save(str(tmp_path), garbage=1, deflate=False, clean=False)
+
+        result = subprocess.run(
+            ["mutool", "clean", "-gggg", "-z", str(tmp_path), str(pdf_path)],
+            capture_output=True,
+        )
+        if result.returncode == 0:
+            tmp_path.unlink(missing_ok=True)
+            return
+
+        error_msg = result.stderr.decode() if result.stderr else "不明なエラー"
+        logger.warning("mutoolでの最適化に失敗しました: %s", error_msg)
+        # 未最適化でも有効なPDFなのでそのまま採用する
+        tmp_path.replace(pdf_path)
+
     def _log_completion(self, md_path: Path, pdf_path: Path) -> None:
         """完了メッセージを出力"""
         logger.info("処理が完了しました:")
         logger.info("  Markdown: %s", md_path)
         logger.info("  PDF: %s", pdf_path)
 
+    def _run_capture_and_ocr_pipelined(self, max_workers: int = 4) -> None:
+        """
+        スクリーンショット取得とOCRをパイプライン実行する
+
+        キャプチャをプロデューサ、OCRワーカーをコンシューマとして
+        queue.Queueで接続し、ページ送り待ちの裏でOCRを進める。
+        Visionフレームワークは認識中にGILを解放するため、
+        ワーカースレッドでのOCRがキャプチャと並行に動く。
+        """
+        page_queue: queue.Queue[tuple[int, Path] | None] = queue.Queue(
+            maxsize=PIPELINE_QUEUE_SIZE
+        )
+        ocr_config = self.config.ocr
+
+        def ocr_worker() -> None:
+            while True:
+                item = page_queue.get()
+                if item is None:
+                    break
+                page_num, image_path = item
+                try:
+                    # ページ番号は重複しないためdictへの書き込みは競合しない
+                    self.ocr_results[page_num] = _recognize_with_retry(
+                        image_path, ocr_config
+                    )
+                except Exception as e:
+                    logger.warning("OCR失敗 - %s: %s", image_path.name, e)
+                    self.ocr_results[page_num] = ""
+
+        workers = [
+            threading.Thread(target=ocr_worker, daemon=True) for _ in range(max_workers)
+        ]
+        for worker in workers:
+            worker.start()
+
+        try:
+            self.take_screenshots(
+                on_page_ready=lambda page_num, path: page_queue.put((page_num, path))
+            )
+        finally:
+            for _ in workers:
+                page_queue.put(None)
+            for worker in workers:
+                worker.join()
+
+        logger.info("OCR処理が完了しました（%dページ）", len(self.ocr_results))
+
     def run(self) -> tuple[Path, Path]:
         """メイン処理の実行"""
-        self.take_screenshots()
-        self.perform_ocr()
+        if self.config.ocr.framework == FRAMEWORK_VISION:
+            # visionの場合はキャプチャとOCRを重ねて実行
+            self._run_capture_and_ocr_pipelined()
+        else:
+            self.take_screenshots()
+            self.perform_ocr()
         md_path = self.create_markdown()
         pdf_path = self.create_pdf()
         self._log_completion(md_path, pdf_path)
@@ -580,6 +1048,17 @@ def main() -> None:
         "-o",
         help="出力ファイル名（拡張子なし）",
     )
+    parser.add_argument(
+        "--ocr-framework",
+        choices=["livetext", "vision"],
+        default="livetext",
+        help="OCRフレームワーク (livetext: 高精度/逐次, vision: スレッド並列)",
+    )
+    parser.add_argument(
+        "--grayscale",
+        action="store_true",
+        help="スクリーンショットをグレースケール化（ファイルサイズ・メモリ削減）",
+    )
     parser.add_argument(
         "--screenshot-only",
         "-so",
@@ -613,10 +1092,10 @@ def main() -> None:
     vertical_mode = args.direction == DIRECTION_VERTICAL
 
     # OCR設定
-    ocr_config = OcrConfig(vertical_mode=vertical_mode)
+    ocr_config = OcrConfig(vertical_mode=vertical_mode, framework=args.ocr_framework)
 
     # アプリ設定
-    app_config = AppConfig(ocr=ocr_config)
+    app_config = AppConfig(grayscale=args.grayscale, ocr=ocr_config)
 
     kindle = KindleToPDF(
         direction=args.direction,
@@ -1,14 +1,25 @@
 """macOS OCR処理（ocrmac + LiveText）"""
 
+import hashlib
+import itertools
 import logging
 import re
+import time
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from pathlib import Path
 
 from ocrmac import ocrmac
+from PIL import Image
 
 logger = logging.getLogger(__name__)
 
+# === OCRフレームワークの定数 ===
+FRAMEWORK_LIVETEXT = "livetext"
+FRAMEWORK_VISION = "vision"
+VALID_FRAMEWORKS = (FRAMEWORK_LIVETEXT, FRAMEWORK_VISION)
+
 # === 型エイリアス ===
 BoundingBox = tuple[float, float, float, float]  # (x, y, width, height)
 OcrResult = tuple[str, float, BoundingBox]  # (text, confidence, bbox)
@@ -32,12 +43,48 @@ LINE_THRESHOLD_HORIZONTAL = 0.025
 # 縦書き: X座標がこの範囲内なら同じ列とみなす
 LINE_THRESHOLD_VERTICAL = 0.02
 
+# === OCRリトライの定数 ===
+# 一時的な認識失敗のリトライ回数
+OCR_RETRY_ATTEMPTS = 3
+# リトライ間隔の初期値（秒、指数バックオフ）
+OCR_RETRY_BASE_DELAY = 0.25
+
+# === 空白ページ判定の定数 ===
+# 輝度レンジ（max - min）がこの値以下なら単色＝空白ページとみなす
+BLANK_PAGE_SPREAD_THRESHOLD = 8
+
+# === 並列OCRのバッチサイズ ===
+# 一度に投入する画像数。大量ページの本でも同時に保持する
+# Future/画像リソースをこの数に抑える
+OCR_BATCH_SIZE = 16
+
 # === 日本語文字のUnicode範囲 ===
-_JP_CHARS = r"\u3040-\u309F\u30A0-\u30FF\u4E00-\u9FFF\u3400-\u4DBF\uFF00-\uFFEF\u3000-\u303F"
+_JP_RANGES = (
+    (0x3000, 0x303F),  # 記号・句読点
+    (0x3040, 0x309F),  # ひらがな
+    (0x30A0, 0x30FF),  # カタカナ
+    (0x3400, 0x4DBF),  # CJK統合漢字拡張A
+    (0x4E00, 0x9FFF),  # CJK統合漢字
+    (0xFF00, 0xFFEF),  # 全角英数・半角カナ
+)
+
+
+def _build_jp_flags() -> bytes:
+    """_JP_RANGESを文字コード→フラグのO(1)参照表に展開する"""
+    flags = bytearray(0x10000)
+    for low, high in _JP_RANGES:
+        flags[low : high + 1] = b"\x01" * (high - low + 1)
+    return bytes(flags)
+
+
+# BMP内の全コードポイントに対するフラグ表（64KiB、モジュール読込時に1回構築）
+_JP_FLAGS = _build_jp_flags()
 
-# 日本語文字に挟まれた空白を検出
-_JAPANESE_SPACING_PATTERN = re.compile(rf"(?<=[{_JP_CHARS}])\s+(?=[{_JP_CHARS}])")
 
+def _is_japanese_char(ch: str) -> bool:
+    """日本語文字（かな・漢字・全角記号）かどうか"""
+    code = ord(ch)
+    return code < 0x10000 and _JP_FLAGS[code] != 0
 
 
 @dataclass
@@ -45,7 +92,9 @@ class OcrConfig:
     """OCR設定"""
 
     languages: list[str] = field(default_factory=lambda: ["ja", "en"])
+    framework: str = FRAMEWORK_LIVETEXT  # "livetext" または "vision"
     vertical_mode: bool = False  # 縦書きモード（右→左、上→下にソート）
+    cache_enabled: bool = True  # OCR結果のディスクキャッシュ（再実行時の再OCR回避）
 
 
 def _remove_japanese_spaces(text: str) -> str:
@@ -54,39 +103,77 @@ def _remove_japanese_spaces(text: str) -> str:
 
     "わ た し" → "わたし"
     "Hello World" → "Hello World" (英語はそのまま)
+
+    以前はlookbehind/lookahead付き正規表現だったが、
+    バックトラックなしの1パス走査の方が速く、挙動も等価。
     """
-    return _JAPANESE_SPACING_PATTERN.sub("", text)
+    result: list[str] = []
+    n = len(text)
+    i = 0
+    prev_jp = False
+
+    while i < n:
+        ch = text[i]
+        if prev_jp and ch.isspace():
+            # 空白の連なりをまとめて読み、直後が日本語文字なら落とす
+            j = i + 1
+            while j < n and text[j].isspace():
+                j += 1
+            if j < n and _is_japanese_char(text[j]):
+                i = j
+                continue
+            # 連なりの途中の全角空白（それ自体が日本語文字）も
+            # 右側の境界になり得るため、最後の1つまでは落とす
+            for k in range(j - 1, i, -1):
+                if _is_japanese_char(text[k]):
+                    result.append(text[k:j])
+                    break
+            else:
+                result.append(text[i:j])
+            prev_jp = False
+            i = j
+            continue
+        result.append(ch)
+        prev_jp = _is_japanese_char(ch)
+        i += 1
+
+    return "".join(result)
 
 
 def _create_ocr_instance(
-    image_path: str | Path,
+    image: str | Path | Image.Image,
     languages: list[str] | None = None,
+    framework: str = FRAMEWORK_LIVETEXT,
 ) -> ocrmac.OCR:
     """
-    OCRインスタンスを生成する（LiveText使用）
+    OCRインスタンスを生成する
 
     Args:
-        image_path: 画像ファイルのパス
+        image: 画像ファイルのパス、またはデコード済みのPIL画像
         languages: 言語設定（デフォルト: ["ja", "en"]）
+        framework: 使用するフレームワーク（"livetext" または "vision"）
 
     Returns:
         設定済みのOCRインスタンス
     """
     if languages is None:
         languages = ["ja", "en"]
+    # ocrmacはパス文字列とPIL画像の両方を受け付ける
+    source = image if isinstance(image, Image.Image) else str(image)
     return ocrmac.OCR(
-        str(image_path),
-        framework="livetext",
+        source,
+        framework=framework,
         language_preference=languages,
     )
 
 
-def detect_text_orientation(image_path: str | Path) -> tuple[str, float]:
+def detect_text_orientation(image: str | Path | Image.Image) -> tuple[str, float]:
     """
     画像のテキスト方向を自動検出する
 
     Args:
-        image_path: 画像ファイルのパス
+        image: 画像ファイルのパス、またはデコード済みのPIL画像
+            （デコード済み画像を渡すとPNGの再読込を省ける）
 
     Returns:
         (orientation, confidence):
@@ -94,7 +181,7 @@ def detect_text_orientation(image_path: str | Path) -> tuple[str, float]:
             confidence: 信頼度 (0.0-1.0)
     """
     try:
-        ocr_instance = _create_ocr_instance(image_path)
+        ocr_instance = _create_ocr_instance(image)
         results: OcrResults = ocr_instance.recognize()
     except Exception:
         return ("horizontal", 0.0)
@@ -106,23 +193,24 @@ def detect_text_orientation(image_path: str | Path) -> tuple[str, float]:
     # 縦書き: 読み進めるとx座標が減少（右から左）
     # 横書き: 読み進めるとy座標が減少（上から下）
 
-    # y座標でソート（上から下の読み順を仮定）
-    sorted_by_y = sorted(results, key=lambda r: -r[2][1])
-    x_coords = [r[2][0] for r in sorted_by_y]
-
-    # x座標が減少している割合を計算
-    decreasing_count = sum(
-        1 for i in range(len(x_coords) - 1) if x_coords[i] > x_coords[i + 1]
-    )
-    decreasing_ratio = decreasing_count / (len(x_coords) - 1)
-
     # 方法2: バウンディングボックスのアスペクト比
     # 縦書きの行は縦長になりやすい
+
+    # y座標でソート（上から下の読み順を仮定）し、
+    # x座標の減少回数と縦長ボックス数を1パスで同時に数える
+    sorted_by_y = _sorted_by_coord(results, 1, descending=True)
+    decreasing_count = 0
     vertical_boxes = 0
-    for _text, _conf, bbox in results:
-        _x, _y, width, height = bbox
+    prev_x: float | None = None
+
+    for _text, _conf, (x, _y, width, height) in sorted_by_y:
+        if prev_x is not None and prev_x > x:
+            decreasing_count += 1
+        prev_x = x
         if height > width * ASPECT_RATIO_THRESHOLD:
             vertical_boxes += 1
+
+    decreasing_ratio = decreasing_count / (len(results) - 1)
     vertical_ratio = vertical_boxes / len(results)
 
     # 両方の指標を組み合わせて判定
@@ -135,6 +223,30 @@ def detect_text_orientation(image_path: str | Path) -> tuple[str, float]:
         return ("horizontal", 1.0 - combined_score)
 
 
+def _sorted_by_coord(
+    results: list[OcrResult], axis: int, descending: bool = False
+) -> list[OcrResult]:
+    """
+    bbox座標の1軸をキーにソートする
+
+    (キー, 元位置, 要素)のタプル列を組んでからソートする
+    （decorate-sort-undecorate）ため、比較はすべてC実装の
+    タプル比較で済み、要素ごとのlambda呼び出しが発生しない。
+    元位置を挟むことで安定性も保たれる。
+
+    Args:
+        results: OCR結果のリスト
+        axis: bbox内のインデックス（0=x, 1=y）
+        descending: 降順にするか
+    """
+    if descending:
+        decorated = [(-r[2][axis], i, r) for i, r in enumerate(results)]
+    else:
+        decorated = [(r[2][axis], i, r) for i, r in enumerate(results)]
+    decorated.sort()
+    return [item[2] for item in decorated]
+
+
 def _group_by_line_horizontal(results: OcrResults) -> list[list[OcrResult]]:
     """
     横書き用：Y座標が近いテキストを同じ行としてグループ化
@@ -146,7 +258,7 @@ def _group_by_line_horizontal(results: OcrResults) -> list[list[OcrResult]]:
         return []
 
     # Y座標（中心）でソート（上から下）
-    sorted_results = sorted(results, key=lambda r: -r[2][1])
+    sorted_results = _sorted_by_coord(results, 1, descending=True)
 
     lines: list[list[OcrResult]] = []
     current_line: list[OcrResult] = [sorted_results[0]]
@@ -166,10 +278,7 @@ def _group_by_line_horizontal(results: OcrResults) -> list[list[OcrResult]]:
     lines.append(current_line)
 
     # 各行内をX座標でソート（左から右）
-    for line in lines:
-        line.sort(key=lambda r: r[2][0])
-
-    return lines
+    return [_sorted_by_coord(line, 0) for line in lines]
 
 
 def _group_by_line_vertical(results: OcrResults) -> list[list[OcrResult]]:
@@ -183,7 +292,7 @@ def _group_by_line_vertical(results: OcrResults) -> list[list[OcrResult]]:
         return []
 
     # X座標でソート（右から左）
-    sorted_results = sorted(results, key=lambda r: -r[2][0])
+    sorted_results = _sorted_by_coord(results, 0, descending=True)
 
     columns: list[list[OcrResult]] = []
     current_column: list[OcrResult] = [sorted_results[0]]
@@ -203,10 +312,7 @@ def _group_by_line_vertical(results: OcrResults) -> list[list[OcrResult]]:
     columns.append(current_column)
 
     # 各列内をY座標でソート（上から下）
-    for column in columns:
-        column.sort(key=lambda r: -r[2][1])
-
-    return columns
+    return [_sorted_by_coord(column, 1, descending=True) for column in columns]
 
 
 def _merge_line_text(line: list[OcrResult]) -> str:
@@ -215,114 +321,111 @@ def _merge_line_text(line: list[OcrResult]) -> str:
 
     日本語文字同士はスペースなしで結合
     """
-    texts = [result[0] for result in line]
-    merged = "".join(texts)
     # 日本語文字間の不要なスペースを除去
-    return _remove_japanese_spaces(merged)
+    return _remove_japanese_spaces("".join(result[0] for result in line))
 
 
 # === 改行ルール（LLM RAG処理用に最適化） ===
 # 改行する箇所：読点、箇条書き、項番、章タイトル
 # それ以外は結合
 
-# 箇条書きパターン
-_BULLET_PATTERN = re.compile(r"^[・･●■▶▷◆◇○◎★☆\-‐－―]+")
+# 章タイトルパターン（break_after判定にも使うため単独でも保持）
+# 大文字小文字を無視するのはASCIIの章キーワードだけなので、
+# 全体フラグのIGNORECASEではなく(?ai:...)でスコープを絞り、
+# Unicode大文字小文字表の参照を避ける
+_CHAPTER_PATTERN = re.compile(
+    r"^((?ai:chapter|section)\s*[0-9]+|"
+    r"第[0-9一二三四五六七八九十百千]+[章節編部話回]|"
+    r"はじめに|おわりに|まとめ|序章|終章|"
+    r"目次|索引|参考文献|付録|あとがき|謝辞|著者紹介)$"
+)
 
-# 項番パターン（1. 1-1 1.1 (1) ① など）
-_NUMBERED_PATTERN = re.compile(
-    r"^([0-9]+[\.\-][0-9]*|"
+# 行頭改行パターン（箇条書き・項番・章タイトルを1つに融合）
+# 3パターンを順に試すより1回のmatchで済ませる方が速い。
+# 大文字小文字の区別は章タイトルのASCII部分だけ緩めたいので、
+# 全体フラグではなくインライングループ(?i:...)でスコープを絞る
+_BREAK_BEFORE_PATTERN = re.compile(
+    # 箇条書き
+    r"^(?:[・･●■▶▷◆◇○◎★☆\-‐－―]+|"
+    # 項番（1. 1-1 1.1 (1) ① など）
+    r"[0-9]+[\.\-][0-9]*|"
     r"\([0-9]+\)|"
     r"[①②③④⑤⑥⑦⑧⑨⑩⑪⑫⑬⑭⑮⑯⑰⑱⑲⑳]|"
     r"[ⅰⅱⅲⅳⅴⅵⅶⅷⅸⅹ]|"
     r"[a-z]\)|"
-    r"[A-Z]\.)"
-)
-
-# 章タイトルパターン
-_CHAPTER_PATTERN = re.compile(
-    r"^(第[0-9一二三四五六七八九十百千]+[章節編部話回]|"
-    r"Chapter\s*[0-9]+|CHAPTER\s*[0-9]+|"
-    r"Section\s*[0-9]+|SECTION\s*[0-9]+|"
+    r"[A-Z]\.|"
+    # 章タイトル（行全体に一致する場合のみ）
+    r"(?:第[0-9一二三四五六七八九十百千]+[章節編部話回]|"
+    r"(?ai:chapter|section)\s*[0-9]+|"
     r"はじめに|おわりに|まとめ|序章|終章|"
-    r"目次|索引|参考文献|付録|あとがき|謝辞|著者紹介)$",
-    re.IGNORECASE
+    r"目次|索引|参考文献|付録|あとがき|謝辞|著者紹介)$)"
 )
 
 
-def _should_break_before(line: str) -> bool:
-    """この行の前で改行すべきかを判定"""
-    stripped = line.strip()
-    if not stripped:
-        return False
-
-    # 箇条書き
-    if _BULLET_PATTERN.match(stripped):
-        return True
-
-    # 項番
-    if _NUMBERED_PATTERN.match(stripped):
-        return True
-
-    # 章タイトル
-    if _CHAPTER_PATTERN.match(stripped):
-        return True
+def _line_break_flags(line: str) -> tuple[bool, bool, bool]:
+    """
+    改行判定に必要な行の属性を一度にまとめて返す
 
-    return False
+    LLM RAG処理用の改行ルール：
+    - 読点「。」の後 → 改行
+    - 箇条書き・項番・章の前 → 改行
+    - それ以外 → 結合
 
+    各行は「現在行」と「次の行」の両方の立場で参照されるため、
+    strip・正規表現マッチを行ごとに1回だけ実行して結果を使い回す。
 
-def _should_break_after(line: str) -> bool:
-    """この行の後で改行すべきかを判定"""
+    Returns:
+        (空行でないか, この行の前で改行すべきか, この行の後で改行すべきか)
+    """
     stripped = line.strip()
     if not stripped:
-        return True
-
-    # 読点「。」で終わる
-    if stripped.endswith("。"):
-        return True
+        return False, False, True
 
-    # 章タイトル
-    if _CHAPTER_PATTERN.match(stripped):
-        return True
-
-    return False
+    break_before = _BREAK_BEFORE_PATTERN.match(stripped) is not None
+    # 章タイトルの再判定はbreak_beforeに一致した行だけに絞る
+    break_after = stripped.endswith("。") or (
+        break_before and _CHAPTER_PATTERN.match(stripped) is not None
+    )
+    return True, break_before, break_after
 
 
-def _should_keep_line_break(current_line: str, next_line: str | None) -> bool:
+def _iter_merged_paragraphs(lines: Iterable[str]) -> Iterator[str]:
     """
-    現在の行の後に改行を保持すべきかを判定
+    文章の途中の改行を削除し、段落を順に生成する
 
-    LLM RAG処理用に最適化：
-    - 読点「。」の後 → 改行
-    - 箇条書き・項番・章の前 → 改行
-    - それ以外 → 結合
+    全体を1つの文字列に結合せずに済むよう、段落単位でyieldする。
+    1行先読みのみで処理するため、リスト化されていない
+    イテレータもそのまま受け取れる。
 
     Args:
-        current_line: 現在の行
-        next_line: 次の行（なければNone）
+        lines: 行の反復可能オブジェクト
 
-    Returns:
-        True: 改行を保持, False: 次の行と結合
+    Yields:
+        結合済みの段落
     """
-    # 次の行がない場合は改行を保持
-    if next_line is None:
-        return True
-
-    next_stripped = next_line.strip()
-
-    # 次の行が空の場合は改行を保持
-    if not next_stripped:
-        return True
+    current_paragraph: list[str] = []
+    iterator = iter(lines)
+    line = next(iterator, None)
+    if line is None:
+        return
+    flags = _line_break_flags(line)
+
+    while line is not None:
+        next_line = next(iterator, None)
+        next_flags = _line_break_flags(next_line) if next_line is not None else None
+        current_paragraph.append(line)
 
-    # 現在の行の後で改行すべき
-    if _should_break_after(current_line):
-        return True
+        # 次の行がない/空、現在行の後で改行、次の行の前で改行 → 段落確定
+        if next_flags is None or not next_flags[0] or flags[2] or next_flags[1]:
+            yield "".join(current_paragraph)
+            current_paragraph = []
 
-    # 次の行の前で改行すべき
-    if _should_break_before(next_stripped):
-        return True
+        line = next_line
+        flags = next_flags
 
-    # それ以外はすべて結合
-    return False
+    # 残りがあれば返す
+    if current_paragraph:
+        yield "".join(current_paragraph)
 
 
 def _merge_paragraph_lines(lines: list[str]) -> str:
@@ -338,35 +441,21 @@ def _merge_paragraph_lines(lines: list[str]) -> str:
     if not lines:
         return ""
 
-    result_parts: list[str] = []
-    current_paragraph: list[str] = []
-
-    for i, line in enumerate(lines):
-        next_line = lines[i + 1] if i + 1 < len(lines) else None
-
-        current_paragraph.append(line)
-
-        if _should_keep_line_break(line, next_line):
-            # 段落を結合して追加
-            result_parts.append("".join(current_paragraph))
-            current_paragraph = []
-
-    # 残りがあれば追加
-    if current_paragraph:
-        result_parts.append("".join(current_paragraph))
-
-    return "\n".join(result_parts)
+    return "\n".join(_iter_merged_paragraphs(lines))
 
 
 def recognize_text(
-    image_path: str | Path,
+    image: str | Path | Image.Image,
     config: OcrConfig | None = None,
 ) -> str:
     """
     macOS LiveTextでテキストを認識する
 
+    PIL Imageを直接渡すと、ファイルの再読込・PNG再デコードを
+    スキップできる（すでに画像をメモリに持っている呼び出し側向け）。
+
     Args:
-        image_path: 画像ファイルのパス
+        image: 画像ファイルのパス、またはデコード済みPIL Image
         config: OCR設定（デフォルト: 日本語/英語）
 
     Returns:
@@ -380,8 +469,9 @@ def recognize_text(
 
     try:
         ocr_instance = _create_ocr_instance(
-            image_path,
+            image,
             languages=config.languages,
+            framework=config.framework,
         )
         results: OcrResults = ocr_instance.recognize()
     except Exception as e:
@@ -403,21 +493,93 @@ def recognize_text(
     return _merge_paragraph_lines(text_lines)
 
 
+# 並列OCR用の共有スレッドプール（バッチをまたいでワーカーを使い回す）
+_ocr_executor: ThreadPoolExecutor | None = None
+_ocr_executor_workers = 0
+
+
+def _get_ocr_executor(max_workers: int) -> ThreadPoolExecutor:
+    """並列OCR用の共有スレッドプールを取得する（遅延生成）"""
+    global _ocr_executor, _ocr_executor_workers
+    if _ocr_executor is None or _ocr_executor_workers != max_workers:
+        if _ocr_executor is not None:
+            _ocr_executor.shutdown(wait=False)
+        _ocr_executor = ThreadPoolExecutor(max_workers=max_workers)
+        _ocr_executor_workers = max_workers
+    return _ocr_executor
+
+
+def _is_blank_image(image_path: str | Path) -> bool:
+    """
+    ほぼ単色の空白ページかどうかを輝度レンジで判定する
+
+    章区切りなどの真っ白なページはOCRしても空文字になるだけなので、
+    デコード1回で済むこの判定でLiveText/Vision呼び出し自体を省く。
+    判定できない場合は安全側に倒してFalseを返す。
+    """
+    try:
+        with Image.open(image_path) as img:
+            extrema = img.getextrema()
+    except OSError:
+        return False
+    if isinstance(extrema[0], tuple):
+        # RGB/RGBA等はバンドごとの(min, max)が返る
+        spread = max(high - low for low, high in extrema)
+    else:
+        low, high = extrema
+        spread = high - low
+    return spread <= BLANK_PAGE_SPREAD_THRESHOLD
+
+
+def _recognize_with_retry(
+    image_path: str | Path,
+    config: OcrConfig,
+) -> str:
+    """
+    一時的なOCR失敗を指数バックオフ付きリトライで吸収する
+
+    LiveText/Visionはメモリ逼迫時などにまれに失敗するが、
+    多くは再実行で成功する。最終試行の失敗はそのまま送出する。
+    """
+    if _is_blank_image(image_path):
+        logger.debug("空白ページのためOCRをスキップ: %s", Path(image_path).name)
+        return ""
+
+    for attempt in range(1, OCR_RETRY_ATTEMPTS + 1):
+        try:
+            return recognize_text(image_path, config)
+        except RuntimeError as e:
+            if attempt == OCR_RETRY_ATTEMPTS:
+                raise
+            delay = OCR_RETRY_BASE_DELAY * (2 ** (attempt - 1))
+            logger.debug(
+                "OCRをリトライします (%d/%d) - %s: %s",
+                attempt,
+                OCR_RETRY_ATTEMPTS,
+                Path(image_path).name,
+                e,
+            )
+            time.sleep(delay)
+    raise RuntimeError("unreachable")  # pragma: no cover
+
+
 def recognize_text_batch(
     image_paths: list[str | Path],
     config: OcrConfig | None = None,
-    max_workers: int = 4,  # 互換性のため残すが使用しない
+    max_workers: int = 4,
 ) -> list[str]:
     """
     複数の画像に対してOCRを実行する
 
     注意: macOSのLiveTextはメインスレッドでのみ動作するため、
-    シーケンシャル実行を行う。
+    livetextフレームワークではシーケンシャル実行を行う。
+    Visionフレームワークは認識中にGILを解放するため、
+    スレッドプールで並列実行する。
 
     Args:
         image_paths: 画像ファイルパスのリスト
         config: OCR設定
-        max_workers: 互換性のため残すが使用しない
+        max_workers: 並列実行時のワーカー数（visionフレームワークのみ有効）
 
     Returns:
         認識されたテキストのリスト（画像の順序と対応）
@@ -425,12 +587,119 @@ def recognize_text_batch(
     if config is None:
         config = OcrConfig()
 
+    unique_paths, digests, index_map = _dedupe_by_content(image_paths, config)
+    if len(unique_paths) < len(image_paths):
+        logger.info(
+            "重複ページを検出: %d枚中%d枚のみOCRを実行します",
+            len(image_paths),
+            len(unique_paths),
+        )
+
+    # ディスクキャッシュに残っている結果は再OCRしない
+    unique_results: list[str | None] = [None] * len(unique_paths)
+    if config.cache_enabled:
+        for i, digest in enumerate(digests):
+            unique_results[i] = _load_cached_text(digest)
+        hits = sum(1 for r in unique_results if r is not None)
+        if hits:
+            logger.info("OCRキャッシュ命中: %d/%d", hits, len(unique_paths))
+
+    pending = [i for i, r in enumerate(unique_results) if r is None]
+    if pending:
+        pending_paths = [unique_paths[i] for i in pending]
+        if config.framework == FRAMEWORK_VISION:
+            texts = _recognize_batch_parallel(pending_paths, config, max_workers)
+        else:
+            texts = _recognize_batch_sequential(pending_paths, config)
+        for i, text in zip(pending, texts, strict=True):
+            unique_results[i] = text
+            # 空文字はOCR失敗時のフォールバック値と区別できないため残さない
+            if config.cache_enabled and text:
+                _store_cached_text(digests[i], text)
+
+    return [unique_results[i] or "" for i in index_map]
+
+
+def _config_cache_key(config: OcrConfig) -> bytes:
+    """OCR結果を左右する設定をハッシュキーに混ぜるためのバイト列"""
+    return f"{config.framework}:{','.join(config.languages)}:{config.vertical_mode}".encode()
+
+
+def _dedupe_by_content(
+    image_paths: list[str | Path],
+    config: OcrConfig,
+) -> tuple[list[str | Path], list[bytes], list[int]]:
+    """
+    内容が同一の画像をまとめ、ユニークなパス・ハッシュと逆引き表を返す
+
+    目次や章扉・空白ページなどバイト単位で同一のページはOCR結果も
+    同一になるため、1枚だけ認識して結果を使い回す。ハッシュは
+    ファイルバイト列のblake2bで、知覚ハッシュと違い誤同一視がない。
+    OCR設定もキーに混ぜるため、同じ画像でも設定が違えば別エントリになる。
+
+    Returns:
+        (ユニークなパス, 対応するハッシュ, 元の各画像→ユニーク側インデックスの対応)
+    """
+    config_key = _config_cache_key(config)
+    unique_paths: list[str | Path] = []
+    unique_digests: list[bytes] = []
+    seen: dict[bytes, int] = {}
+    index_map: list[int] = []
+
+    for path in image_paths:
+        hasher = hashlib.blake2b(config_key, digest_size=16)
+        with open(path, "rb") as f:
+            hasher.update(f.read())
+        digest = hasher.digest()
+        index = seen.get(digest)
+        if index is None:
+            index = len(unique_paths)
+            seen[digest] = index
+            unique_paths.append(path)
+            unique_digests.append(digest)
+        index_map.append(index)
+
+    return unique_paths, unique_digests, index_map
+
+
+# === OCR結果のディスクキャッシュ ===
+# 同一画像・同一設定の再実行（--from-screenshotsでのやり直し等）で
+# LiveText/Visionの呼び出し自体をスキップする
+OCR_CACHE_DIR = Path.home() / ".cache" / "kindle-ocr"
+
+
+def _cache_path(digest: bytes) -> Path:
+    return OCR_CACHE_DIR / f"{digest.hex()}.txt"
+
+
+def _load_cached_text(digest: bytes) -> str | None:
+    """ディスクキャッシュからOCR結果を読む（なければNone）"""
+    try:
+        return _cache_path(digest).read_text(encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _store_cached_text(digest: bytes, text: str) -> None:
+    """OCR結果をディスクキャッシュへ書く（失敗はログのみ）"""
+    try:
+        OCR_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        _cache_path(digest).write_text(text, encoding="utf-8")
+    except OSError as e:
+        logger.debug("OCRキャッシュの書き込みに失敗しました: %s", e)
+
+
+def _recognize_batch_sequential(
+    image_paths: list[str | Path],
+    config: OcrConfig,
+) -> list[str]:
+    """OCRをシーケンシャルに実行する（livetext用）"""
     total = len(image_paths)
     results: list[str] = []
 
     for i, path in enumerate(image_paths):
         try:
-            text = recognize_text(path, config)
+            text = _recognize_with_retry(path, config)
             results.append(text)
         except Exception as e:
             logger.warning("OCR失敗 - %s: %s", Path(path).name, e)
@@ -438,3 +707,57 @@ def recognize_text_batch(
         logger.info("OCR処理中: %d/%d 完了", i + 1, total)
 
     return results
+
+
+def _warmup_ocr_workers(
+    executor: ThreadPoolExecutor,
+    config: OcrConfig,
+    workers: int,
+) -> None:
+    """
+    各ワーカーで極小画像を1枚認識し、フレームワーク初期化を先に済ませる
+
+    Visionは初回認識時にモデル読込コストを払うため、バッチ投入前に
+    全ワーカーを温めておくと先頭ページ群の処理時間が揃う。
+    ウォームアップ自体の失敗は本処理に影響しないので無視する。
+    """
+    futures = [
+        executor.submit(recognize_text, Image.new("RGB", (32, 32), "white"), config)
+        for _ in range(workers)
+    ]
+    for future in futures:
+        try:
+            future.result()
+        except Exception as e:
+            logger.debug("OCRウォームアップに失敗しました: %s", e)
+
+
+def _recognize_batch_parallel(
+    image_paths: list[str | Path],
+    config: OcrConfig,
+    max_workers: int,
+) -> list[str]:
+    """OCRをスレッドプールで並列実行する（vision用）"""
+    total = len(image_paths)
+    executor = _get_ocr_executor(max_workers)
+    _warmup_ocr_workers(executor, config, max_workers)
+
+    counter = itertools.count(1)
+
+    def _safe_recognize(path: str | Path) -> str:
+        """失敗を空文字に落とし、完了ログをワーカー側で出す"""
+        try:
+            text = _recognize_with_retry(path, config)
+        except Exception as e:
+            logger.warning("OCR失敗 - %s: %s", Path(path).name, e)
+            text = ""
+        logger.info("OCR処理中: %d/%d 完了", next(counter), total)
+        return text
+
+    # executor.mapは入力順に結果を返すため、インデックスの管理が不要。
+    # バッチ単位で投入して同時に滞留するFutureの数を抑える
+    results: list[str] = []
+    for start in range(0, total, OCR_BATCH_SIZE):
+        batch = image_paths[start : start + OCR_BATCH_SIZE]
+        results.extend(executor.map(_safe_recognize, batch))
+    return results